@@ -1,15 +1,11 @@
 import os
-import csv
 import json
+import asyncio
+import functools
 import time
 import logging
 import requests
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-import matplotlib.font_manager as fm
-import geopandas as gpd
-import contextily as ctx
-from shapely.geometry import Point, LineString
+import numpy as np
 import pandas as pd
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
@@ -18,49 +14,338 @@ from .exceptions import (
     FR24NotFoundError, FR24ServerError, FR24ClientError, 
     FR24ValidationError, FR24ConnectionError
 )
-import matplotlib.dates as mdates
 import datetime
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from xml.sax.saxutils import escape as xml_escape
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
-# Configure default font
+# Exception class and message for HTTP statuses with a dedicated error
+_STATUS_ERRORS = {
+    401: (FR24AuthenticationError, "Authentication failed. Check your API token."),
+    403: (FR24AuthenticationError, "Access forbidden. Check your API token permissions."),
+    404: (FR24NotFoundError, "Resource not found: {url}"),
+    429: (FR24RateLimitError, "Rate limit exceeded. Try again later."),
+}
+
+def _parse_retry_after(value):
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Args:
+        value: Header value
+
+    Returns:
+        float: Seconds to wait, or None if the header is missing or invalid
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.datetime.now(retry_at.tzinfo)).total_seconds())
+
+# Input formats accepted by the validation helpers
+_ISO_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$')
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_FLIGHT_NUMBER_RE = re.compile(r'^[A-Z0-9]{2}\d{1,4}[A-Z]?$')  # e.g. BA123, DL456
+_FLIGHT_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+$')  # alphanumeric with underscores and hyphens
+
+# Plotting libraries are imported on first use so API-only callers don't pay for them
+_plt = None
+_font_configured = False
+_ctx = None
+_to_web_mercator = None
+_PLOT_LOCK = threading.Lock()
+
+def _png_options(compress_level):
+    """
+    Build Pillow's PNG save options for a zlib compression level.
+
+    Level 1 saves several times faster than Pillow's default level 6, but
+    files can be twice as large, so it is only used when asked for.
+
+    Args:
+        compress_level: zlib level from 0 to 9, or None for the default
+
+    Returns:
+        dict: pil_kwargs for savefig, or None to keep the default
+    """
+    return None if compress_level is None else {"compress_level": compress_level}
+
 def _configure_font():
-    """Configure the default font for plots."""
-    # Try to find Roboto in system fonts
-    roboto_font = None
-    for font in fm.findSystemFonts():
-        if 'Roboto' in font:
-            roboto_font = font
-            break
+    """Configure the default font for plots on first use."""
+    global _font_configured
+    if _font_configured:
+        return
+    import matplotlib
+    import matplotlib.font_manager as fm
+
+    # Look Roboto up in matplotlib's font list, which matplotlib caches on disk,
+    # instead of walking the system font directories on every run
+    roboto_font = any(font.name == 'Roboto' for font in fm.fontManager.ttflist)
     
     # If Roboto not found, use the default sans-serif font
     if roboto_font:
-        plt.rcParams['font.family'] = 'sans-serif'
-        plt.rcParams['font.sans-serif'] = ['Roboto']
+        matplotlib.rcParams['font.family'] = 'sans-serif'
+        matplotlib.rcParams['font.sans-serif'] = ['Roboto']
     else:
         logger.debug("Using system default sans-serif font")
+    _font_configured = True
+
+def _get_contextily():
+    """Import contextily and point its tile cache at a persistent directory on first use."""
+    global _ctx
+    if _ctx is None:
+        import contextily as ctx
+        cache_dir = os.environ.get("PYFR24_TILE_CACHE", os.path.expanduser("~/.cache/pyfr24/tiles"))
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            ctx.set_cache_dir(cache_dir)
+        except OSError as e:
+            logger.debug("Using contextily's session tile cache: %s", e)
+        _ctx = ctx
+    return _ctx
 
-# Configure font when module is imported
-_configure_font()
+def _get_web_mercator_transformer():
+    """Create the WGS84 to Web Mercator transformer on first use and reuse it afterwards."""
+    global _to_web_mercator
+    if _to_web_mercator is None:
+        from pyproj import Transformer
+        _to_web_mercator = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
+    return _to_web_mercator
 
-def _create_kml_from_tracks(tracks, flight_id):
+def _get_pyplot():
+    """Import matplotlib.pyplot and configure the default font on first use."""
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot as plt
+        _configure_font()
+        _plt = plt
+    return _plt
+
+def _new_figure(figsize):
     """
-    Create a KML string from flight track data.
-    
+    Create a figure drawn by Agg without going through pyplot.
+
+    pyplot gives new figures a canvas from the default backend, which may be a GUI
+    toolkit that only works on the main thread. Figures that are only saved to files
+    don't need one, so they can be drawn from bulk_export's worker threads.
+
     Args:
-        tracks: List of track points
-        flight_id: Flight identifier for the KML name
-        
+        figsize: Figure size in inches as (width, height)
+
     Returns:
-        str: KML string
+        tuple: (Figure, Axes)
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+def _parse_json(response):
+    """
+    Decode a JSON API response body.
+
+    Uses orjson when it is installed and falls back to requests' decoder.
+
+    Args:
+        response: requests.Response object
+
+    Returns:
+        Decoded JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _write_json(data, path):
+    """
+    Write data to a JSON file with two-space indentation.
+
+    Uses orjson when it is installed and falls back to the standard library.
+
+    Args:
+        data: JSON-serializable data
+        path: Output file path
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+def _write_feature_collection(features, path):
+    """
+    Stream GeoJSON features into a FeatureCollection file one at a time.
+
+    Avoids building the whole collection in memory before it is written.
+
+    Args:
+        features: Iterable of GeoJSON feature dicts
+        path: Output file path
+    """
+    if orjson is not None:
+        def dumps(obj):
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        def dumps(obj):
+            return json.dumps(obj).encode("utf-8")
+
+    with open(path, "wb") as f:
+        f.write(b'{"type": "FeatureCollection", "features": [\n')
+        for i, feature in enumerate(features):
+            if i:
+                f.write(b",\n")
+            f.write(dumps(feature))
+        f.write(b"\n]}\n")
+
+def _parse_utc_timestamp(value):
+    """
+    Parse one timestamp to UTC, treating timestamps without an offset as UTC.
+
+    Args:
+        value: Timestamp string or datetime
+
+    Returns:
+        pandas.Timestamp: UTC timestamp, or NaT if the value can't be parsed
+    """
+    try:
+        ts = pd.Timestamp(value)
+    except (ValueError, TypeError):
+        return pd.NaT
+    if ts is pd.NaT:
+        return pd.NaT
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+def _parse_utc_timestamps(values):
+    """
+    Parse a column of timestamps to UTC in one vectorized call.
+
+    pandas infers a single format from the first value, so timestamps in another
+    ISO 8601 shape (e.g. with fractional seconds) come back as NaT. Those are
+    parsed again one at a time, so only unparseable values are dropped.
+
+    Args:
+        values: Series of timestamp strings or datetimes
+
+    Returns:
+        pandas.Series: UTC timestamps, NaT where a value is missing or invalid
+    """
+    parsed = pd.to_datetime(values, errors="coerce", utc=True)
+    retry = parsed.isna() & values.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime([_parse_utc_timestamp(value) for value in values[retry]], utc=True)
+    return parsed
+
+# Flights pinged this recently may still be in the air (or crossing a coverage gap)
+_LIVE_TRACK_SECONDS = 6 * 3600
+
+def _flight_tracks_ttl(data):
+    """
+    Choose how long a flight tracks response stays cached.
+
+    A flight whose last ping is less than six hours old may still be in the air,
+    so its tracks expire after a minute. Older flights no longer change and are
+    kept for a day, like flight ID pages for past dates.
+
+    Args:
+        data: Flight tracks response
+
+    Returns:
+        int: Seconds the response stays fresh
+    """
+    timestamps = []
+    for item in data if isinstance(data, list) else [data]:
+        if not isinstance(item, dict):
+            continue
+        tracks = item["tracks"] if isinstance(item.get("tracks"), list) else [item]
+        timestamps.extend(track.get("timestamp") for track in tracks if isinstance(track, dict))
+    last_ping = _parse_utc_timestamps(pd.Series(timestamps, dtype=object)).max()
+    if pd.isna(last_ping) or time.time() - last_ping.timestamp() < _LIVE_TRACK_SECONDS:
+        return 60
+    return 86400
+
+def _chart_series(tracks, column, upper):
+    """
+    Extract timestamps and values for a time series chart in one vectorized pass.
+
+    Points without a usable timestamp, or with a value outside 0..upper, are
+    dropped. Missing values count as zero.
+
+    Args:
+        tracks: List of track points or a DataFrame of them
+        column: Track field to plot (e.g. 'gspeed' or 'alt')
+        upper: Largest plausible value for the field
+
+    Returns:
+        tuple: (DatetimeIndex of timestamps, NumPy array of values)
+    """
+    df = pd.DataFrame(tracks, columns=["timestamp", column])
+    raw = df[column]
+    values = pd.to_numeric(raw, errors="coerce").where(raw.notna(), 0)
+    timestamps = _parse_utc_timestamps(df["timestamp"])
+    mask = timestamps.notna() & values.between(0, upper)
+    if not mask.any():
+        return pd.DatetimeIndex([]), np.array([])
+
+    # Keep the time zone of the first timestamp, as it is used to label the x-axis
+    first_tz = pd.Timestamp(df["timestamp"][mask].iloc[0]).tz
+    timestamps = timestamps[mask]
+    timestamps = timestamps.dt.tz_convert(first_tz) if first_tz is not None else timestamps.dt.tz_localize(None)
+    return pd.DatetimeIndex(timestamps), values[mask].to_numpy(dtype=float)
+
+def _convert_timestamps(values, tz):
+    """
+    Convert ISO 8601 timestamps to another time zone.
+
+    Timestamps without an offset are treated as UTC.
+
+    Args:
+        values: List of ISO 8601 timestamp strings
+        tz: Target time zone
+
+    Returns:
+        list: ISO 8601 strings in the target time zone
     """
-    kml_template = """<?xml version="1.0" encoding="UTF-8"?>
+    try:
+        # Parse every timestamp in one call; API tracks share a single format
+        parsed = pd.to_datetime(pd.Series(values, dtype=object), utc=True).dt.tz_convert(tz)
+    except (ValueError, TypeError):
+        # Formats differ between points, so parse them one at a time
+        parsed = (pd.Timestamp(value) for value in values)
+        parsed = (ts if ts.tzinfo is not None else ts.tz_localize("UTC") for ts in parsed)
+        parsed = (ts.astimezone(tz) for ts in parsed)
+    return [ts.isoformat() for ts in parsed]
+
+# Columns written to data.csv, in order
+_CSV_FIELDNAMES = ["timestamp", "lat", "lon", "alt", "gspeed", "vspeed", "track", "squawk", "callsign", "source"]
+
+# KML document pieces, split around the flight name and coordinates
+_KML_HEAD = """<?xml version="1.0" encoding="UTF-8"?>
 <kml xmlns="http://www.opengis.net/kml/2.2">
   <Document>
-    <name>{flight_id}</name>
+    <name>"""
+_KML_STYLE = """</name>
     <Style id="yellowLineGreenPoly">
       <LineStyle>
         <color>7f00ffff</color>
@@ -71,70 +356,188 @@ def _create_kml_from_tracks(tracks, flight_id):
       </PolyStyle>
     </Style>
     <Placemark>
-      <name>{flight_id}</name>
+      <name>"""
+_KML_LINE = """</name>
       <styleUrl>#yellowLineGreenPoly</styleUrl>
       <LineString>
         <extrude>1</extrude>
         <tessellate>1</tessellate>
         <altitudeMode>absolute</altitudeMode>
         <coordinates>
-{coordinates}
+"""
+_KML_TAIL = """
         </coordinates>
       </LineString>
     </Placemark>
   </Document>
 </kml>"""
 
-    # Convert track points to KML coordinates
-    coordinates = []
-    for track in tracks:
-        lon = track.get('lon')
-        lat = track.get('lat')
-        alt = track.get('alt', 0)  # Default to 0 if altitude not available
-        if lon is not None and lat is not None:
-            coordinates.append(f"{lon},{lat},{alt}")
+def _create_kml_from_tracks(tracks, flight_id):
+    """
+    Create a KML string from flight track data.
     
-    return kml_template.format(
-        flight_id=flight_id,
-        coordinates="\n".join(coordinates)
+    Args:
+        tracks: List of track points or a DataFrame with lon, lat and alt columns
+        flight_id: Flight identifier for the KML name
+        
+    Returns:
+        str: KML string
+    """
+    # Convert track points to KML coordinates in one vectorized pass.
+    # Object dtype keeps the original values so they format exactly as before.
+    df = pd.DataFrame(tracks, columns=['lon', 'lat', 'alt'], dtype=object)
+    df = df.dropna(subset=['lon', 'lat'])
+    alt = df['alt'].where(df['alt'].notna(), 0)  # Default to 0 if altitude not available
+    coordinates = (
+        df['lon'].astype(str) + ',' + df['lat'].astype(str) + ',' + alt.astype(str)
+    ).str.cat(sep='\n')
+
+    name = xml_escape(str(flight_id))
+    return "".join((_KML_HEAD, name, _KML_STYLE, name, _KML_LINE, coordinates, _KML_TAIL))
+
+def _simplify_path(lon, lat, tolerance_m):
+    """
+    Select the track points to keep with Ramer-Douglas-Peucker simplification.
+
+    Args:
+        lon: Array of longitudes sorted by timestamp
+        lat: Array of latitudes sorted by timestamp
+        tolerance_m: Simplification tolerance in meters (None or 0 disables it)
+
+    Returns:
+        numpy.ndarray: Boolean mask of the points that lie on the simplified path
+    """
+    valid = ~(np.isnan(lon) | np.isnan(lat))
+    if not tolerance_m or valid.sum() < 3:
+        return valid
+
+    from shapely.geometry import LineString
+
+    # Approximate meters to degrees (one degree of latitude is ~111.32 km)
+    tolerance_deg = tolerance_m / 111320.0
+    line = LineString(np.column_stack([lon[valid], lat[valid]]))
+    keep = set(line.simplify(tolerance_deg, preserve_topology=False).coords)
+    # Simplification only drops vertices, so map the survivors back to their track points
+    return valid & np.fromiter(((x, y) in keep for x, y in zip(lon, lat)), dtype=bool, count=len(lon))
+
+# Sessions shared by FR24API.from_shared, keyed by API token
+_SESSION_LOCK = threading.Lock()
+_SHARED_SESSIONS = {}
+
+def _build_session(token, pool_maxsize=50):
+    """
+    Create a requests session configured for the FR24 API.
+
+    Args:
+        token: API token sent in the Authorization header
+        pool_maxsize: Keep-alive connections kept open for threaded callers
+
+    Returns:
+        requests.Session object with retries and connection pooling
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'application/json',
+        'Accept-Version': 'v1',
+        'Authorization': f'Bearer {token}'
+    })
+
+    # Configure retry strategy. The last response is returned rather than raised
+    # once retries run out, so _make_request can map its status to an FR24 error.
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    # Size the pool for threaded callers such as bulk_export so connections are reused
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=20,
+        pool_maxsize=pool_maxsize,
+        pool_block=False,
     )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 class FR24API:
     """Flightradar24 API client."""
     
-    def __init__(self, token=None):
+    def __init__(self, token=None, cache_size=128, pool_maxsize=50, session=None, timeout=30, max_rate_limit_wait=60):
         """Initialize the FR24 API client.
         
         Args:
             token (str, optional): API token. If not provided, will try to get from environment.
+            cache_size (int, optional): Number of flight track, flight ID, airline and airport responses kept in memory (default: 128).
+            pool_maxsize (int, optional): Keep-alive connections kept open for threaded callers (default: 50).
+            session (requests.Session, optional): Preconfigured session to use instead of creating one.
+            timeout (float or tuple, optional): Seconds to wait for the server before giving up (default: 30).
+                Accepts a (connect, read) tuple like requests; None waits forever.
+            max_rate_limit_wait (float, optional): Longest wait for an exhausted rate limit to reset (default: 60).
+                Longer waits raise FR24RateLimitError instead; None always waits.
         """
         self.token = token or os.getenv('FR24_API_TOKEN') or os.getenv('FLIGHTRADAR_API_KEY')
         if not self.token:
             raise FR24Error("API token is required. Set FR24_API_TOKEN or FLIGHTRADAR_API_KEY environment variable or pass token parameter.")
             
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'application/json',
-            'Accept-Version': 'v1',
-            'Authorization': f'Bearer {self.token}'
-        })
+        # Sessions passed in (including shared ones) belong to the caller and are left open on close()
+        self._owns_session = session is None
+        self.session = session or _build_session(self.token, pool_maxsize)
+        self.timeout = timeout
         
         # Use the module-level logger
         self.logger = logger
-        
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+
+        # Recently fetched flight tracks and static data, most recently used last
+        self.cache_size = cache_size
+        self._response_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Time (epoch seconds) before which the API's rate limit is known to be exhausted
+        self._rate_limited_until = 0.0
+        self.max_rate_limit_wait = max_rate_limit_wait
         
         self.logger.debug("API client ready")
 
+    def close(self):
+        """Close the HTTP session and its pooled connections if this client created it."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @classmethod
+    def from_shared(cls, token=None, pool_maxsize=50, **kwargs):
+        """
+        Create a client that reuses a process-wide session for its token.
+
+        Useful when clients are created per request, since the session, its
+        retry configuration and its warm keep-alive connections are built once.
+
+        Args:
+            token (str, optional): API token. If not provided, will try to get from environment.
+            pool_maxsize (int, optional): Pool size used when the shared session is first built (default: 50).
+            **kwargs: Additional arguments passed to FR24API
+
+        Returns:
+            FR24API instance
+        """
+        token = token or os.getenv('FR24_API_TOKEN') or os.getenv('FLIGHTRADAR_API_KEY')
+        session = None
+        if token:
+            with _SESSION_LOCK:
+                session = _SHARED_SESSIONS.get(token)
+                if session is None:
+                    session = _SHARED_SESSIONS[token] = _build_session(token, pool_maxsize)
+        return cls(token=token, session=session, **kwargs)
+
     def _make_request(self, method, url, **kwargs):
         """
         Make an HTTP request with error handling and retries.
@@ -149,31 +552,39 @@ class FR24API:
             
         Raises:
             FR24AuthenticationError: If authentication fails
-            FR24RateLimitError: If rate limit is exceeded
+            FR24RateLimitError: If rate limit is exceeded, or resets later than max_rate_limit_wait
             FR24NotFoundError: If resource is not found
             FR24ServerError: If server error occurs
             FR24ClientError: If client error occurs
             FR24ConnectionError: If connection error occurs
         """
+        # Wait out an exhausted rate limit instead of spending a request on a 429,
+        # unless it resets so late (e.g. a daily quota) that blocking would hang the caller
+        wait = self._rate_limited_until - time.time()
+        if self.max_rate_limit_wait is not None and wait > self.max_rate_limit_wait:
+            self.logger.error(f"Rate limit reached, resets in {wait:.1f} seconds")
+            raise FR24RateLimitError(f"Rate limit exceeded. Resets in {wait:.0f} seconds.", retry_after=wait)
+        if wait > 0:
+            self.logger.info(f"Rate limit reached, waiting {wait:.1f} seconds")
+            time.sleep(wait)
+
         try:
-            self.logger.debug(f"Making {method.upper()} request to {url}")
-            self.logger.debug(f"Headers: {kwargs.get('headers', {})}")
-            self.logger.debug(f"Params: {kwargs.get('params', {})}")
+            self.logger.debug("Making %s request to %s", method.upper(), url)
+            self.logger.debug("Params: %s", kwargs.get('params', {}))
+            # Without a timeout a stalled connection would block forever
+            kwargs.setdefault("timeout", self.timeout)
             response = self.session.request(method, url, **kwargs)
+            self._update_rate_limit(response.headers)
             
             # Handle different HTTP status codes
-            if response.status_code == 401:
-                self.logger.error(f"Authentication failed. Response: {response.text}")
-                raise FR24AuthenticationError("Authentication failed. Check your API token.")
-            elif response.status_code == 403:
-                self.logger.error(f"Access forbidden. Response: {response.text}")
-                raise FR24AuthenticationError("Access forbidden. Check your API token permissions.")
-            elif response.status_code == 404:
-                self.logger.error(f"Resource not found: {url}")
-                raise FR24NotFoundError(f"Resource not found: {url}")
-            elif response.status_code == 429:
-                self.logger.error("Rate limit exceeded")
-                raise FR24RateLimitError("Rate limit exceeded. Try again later.")
+            status_error = _STATUS_ERRORS.get(response.status_code)
+            if status_error:
+                error_class, message = status_error
+                message = message.format(url=url)
+                self.logger.error(f"{message} Response: {response.text}")
+                if error_class is FR24RateLimitError:
+                    raise error_class(message, retry_after=_parse_retry_after(response.headers.get("Retry-After")))
+                raise error_class(message)
             elif response.status_code >= 500:
                 self.logger.error(f"Server error: {response.status_code}")
                 raise FR24ServerError(f"Server error: {response.status_code}")
@@ -181,8 +592,10 @@ class FR24API:
                 self.logger.error(f"Client error {response.status_code}. Response: {response.text}")
                 raise FR24ClientError(f"Client error: {response.status_code}. Details: {response.text}")
             
-            response.raise_for_status()
             return response
+        except requests.exceptions.Timeout as e:
+            self.logger.error(f"Request timed out: {e}")
+            raise FR24ConnectionError(f"Request timed out: {e}")
         except requests.exceptions.ConnectionError as e:
             self.logger.error(f"Connection error: {e}")
             raise FR24ConnectionError(f"Connection error: {e}")
@@ -190,6 +603,26 @@ class FR24API:
             self.logger.error(f"Request error: {e}")
             raise FR24Error(f"Request error: {e}")
 
+    def _update_rate_limit(self, headers):
+        """
+        Record when the rate limit resets if the response says it is used up.
+
+        Args:
+            headers: Response headers with X-RateLimit-Remaining and X-RateLimit-Reset
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if not isinstance(remaining, str) or not isinstance(reset, str):
+            return
+        try:
+            remaining = int(remaining)
+            reset = float(reset)
+        except ValueError:
+            return
+        if remaining <= 0:
+            # Reset is either a Unix timestamp or a number of seconds from now
+            self._rate_limited_until = reset if reset > 1e9 else time.time() + reset
+
     def _validate_and_format_date(self, date_str):
         """
         Validate and format a date string to ISO format.
@@ -204,13 +637,11 @@ class FR24API:
             FR24ValidationError: If date format is invalid
         """
         # Check if it's already in ISO format
-        iso_pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$'
-        if re.match(iso_pattern, date_str):
+        if _ISO_DATETIME_RE.match(date_str):
             return date_str
             
         # Check if it's in YYYY-MM-DD format
-        date_pattern = r'^\d{4}-\d{2}-\d{2}$'
-        if re.match(date_pattern, date_str):
+        if _DATE_RE.match(date_str):
             return f"{date_str}T00:00:00Z"
             
         raise FR24ValidationError(
@@ -244,11 +675,7 @@ class FR24API:
         for flight in flight_list:
             if not flight:
                 raise FR24ValidationError("Empty flight ID/number found")
-            # Flight number pattern (e.g., BA123, DL456)
-            flight_number_pattern = r'^[A-Z0-9]{2}\d{1,4}[A-Z]?$'
-            # Flight ID pattern (alphanumeric with underscores and hyphens)
-            flight_id_pattern = r'^[a-zA-Z0-9_-]+$'
-            if not (re.match(flight_number_pattern, flight) or re.match(flight_id_pattern, flight)):
+            if not (_FLIGHT_NUMBER_RE.match(flight) or _FLIGHT_ID_RE.match(flight)):
                 raise FR24ValidationError(
                     f"Invalid flight format: {flight}. Must be either a flight number (e.g., BA123) or flight ID"
                 )
@@ -299,8 +726,8 @@ class FR24API:
             params['flight_datetime_to'] = self._validate_and_format_date(flight_datetime_to)
             
         params.update(kwargs)
-        response = self._make_request("get", url, headers=self.session.headers, params=params)
-        return response.json()
+        response = self._make_request("get", url, params=params)
+        return _parse_json(response)
 
     def get_flight_summary_full(self, flights=None, flight_ids=None, flight_datetime_from=None, flight_datetime_to=None, **kwargs):
         """
@@ -346,8 +773,8 @@ class FR24API:
             params['flight_datetime_to'] = self._validate_and_format_date(flight_datetime_to)
             
         params.update(kwargs)
-        response = self._make_request("get", url, headers=self.session.headers, params=params)
-        return response.json()
+        response = self._make_request("get", url, params=params)
+        return _parse_json(response)
 
     def get_live_flights_by_registration(self, registration, bounds=None):
         # Get live flights filtered by aircraft registration.
@@ -355,43 +782,176 @@ class FR24API:
         params = {"registrations": registration}
         if bounds:
             params["bounds"] = bounds
-        response = self._make_request("get", url, headers=self.session.headers, params=params)
-        return response.json()
+        response = self._make_request("get", url, params=params)
+        return _parse_json(response)
 
     def get_airline_light(self, icao):
-        # Get basic airline info by ICAO code.
+        # Get basic airline info by ICAO code. Responses are cached per client.
         url = f"https://fr24api.flightradar24.com/api/static/airlines/{icao}/light"
-        response = self._make_request("get", url, headers=self.session.headers)
-        return response.json()
+        return self._cached_request(("airline", icao), url)
 
     def get_airport_full(self, code):
-        # Get detailed airport info by IATA or ICAO code.
+        # Get detailed airport info by IATA or ICAO code. Responses are cached per client.
         url = f"https://fr24api.flightradar24.com/api/static/airports/{code}/full"
-        response = self._make_request("get", url, headers=self.session.headers)
-        return response.json()
+        return self._cached_request(("airport", code), url)
 
     def get_flight_positions_light(self, bounds, **kwargs):
         # Get real-time flight positions within specified bounds.
         url = f"https://fr24api.flightradar24.com/api/live/flight-positions/light"
         params = {"bounds": bounds}
         params.update(kwargs)
-        response = self._make_request("get", url, headers=self.session.headers, params=params)
-        return response.json()
+        response = self._make_request("get", url, params=params)
+        return _parse_json(response)
 
     def get_flight_tracks(self, flight_id):
-        # Get flight tracks (ADS-B pings) using the flight ID.
+        # Get flight tracks (ADS-B pings) using the flight ID. Responses are cached per client,
+        # briefly while the flight may still be in the air.
         url = f"https://fr24api.flightradar24.com/api/flight-tracks"
         params = {"flight_id": flight_id}
-        response = self._make_request("get", url, headers=self.session.headers, params=params)
-        return response.json()
+        return self._cached_request(("flight-tracks", flight_id), url, params, ttl=_flight_tracks_ttl)
+
+    def _cached_request(self, key, url, params=None, ttl=None):
+        """
+        Make a GET request, reusing the cached response for the same key.
+
+        Only successful responses are cached, and the least recently used entry
+        is evicted once the cache holds more than cache_size responses.
+
+        Args:
+            key: Tuple identifying the response
+            url: URL to request
+            params: Query parameters
+            ttl: Seconds the response stays fresh, or a function that picks them from
+                 the decoded response (default: None, never expires)
+
+        Returns:
+            Decoded JSON data
+        """
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > time.monotonic()):
+                self._response_cache.move_to_end(key)
+                self.logger.debug("Using cached response for %s", key)
+                return entry[1]
+
+        response = self._make_request("get", url, params=params)
+        data = _parse_json(response)
+
+        if callable(ttl):
+            ttl = ttl(data)
+        expires = time.monotonic() + ttl if ttl is not None else None
+        with self._cache_lock:
+            self._response_cache[key] = (expires, data)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.cache_size:
+                self._response_cache.popitem(last=False)
+        return data
+
+    def gather_flight_tracks(self, flight_ids, max_workers=8):
+        """
+        Fetch tracks for several flights concurrently.
+
+        Requests run in a thread pool so their network round trips overlap
+        instead of adding up one after another.
+
+        Args:
+            flight_ids: List of flight identifiers
+            max_workers: Maximum number of requests in flight at the same time (default: 8)
+
+        Returns:
+            dict: Flight tracks response for each flight ID, or None if the request failed
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(flight_ids, executor.map(self._get_flight_tracks_or_none, flight_ids)))
+
+    def _get_flight_tracks_or_none(self, flight_id):
+        """
+        Fetch tracks for one flight of a batch, logging failures instead of raising.
+
+        Args:
+            flight_id: Flight identifier
+
+        Returns:
+            dict: Flight tracks response, or None if the request failed
+        """
+        try:
+            return self.get_flight_tracks(flight_id)
+        except FR24Error as e:
+            self.logger.error(f"Error fetching tracks for {flight_id}: {e}")
+            return None
+
+    async def _run_async(self, func, *args, **kwargs):
+        """
+        Run a blocking client method in the event loop's default executor.
+
+        Args:
+            func: Method to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The method's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def get_flight_tracks_async(self, flight_id):
+        """
+        Async version of get_flight_tracks.
+
+        Args:
+            flight_id: Flight identifier
+
+        Returns:
+            dict: Flight tracks response
+        """
+        return await self._run_async(self.get_flight_tracks, flight_id)
+
+    async def export_flight_data_async(self, flight_id, **kwargs):
+        """
+        Async version of export_flight_data.
+
+        Args:
+            flight_id: Flight identifier
+            **kwargs: Additional arguments passed to export_flight_data
+
+        Returns:
+            str: Output directory path
+        """
+        return await self._run_async(self.export_flight_data, flight_id, **kwargs)
 
-    def enhanced_plot_flight(self, sorted_tracks, flight_id, fig_filename=None, orientation='horizontal', pad_factor=0.2, zoom=None, background='carto', flight_number=None, origin=None, destination=None):
+    async def gather_flight_tracks_async(self, flight_ids, max_concurrency=10):
         """
-        Enhanced plot of flight data using geopandas and contextily.
-        Converts the track list into a GeoDataFrame, adds a basemap and plots points and a connecting line.
+        Fetch tracks for several flights concurrently from async code.
+
+        Args:
+            flight_ids: List of flight identifiers
+            max_concurrency: Maximum number of requests in flight at the same time (default: 10)
+
+        Returns:
+            dict: Flight tracks response for each flight ID, or None if the request failed
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(flight_id):
+            async with semaphore:
+                return await self._run_async(self._get_flight_tracks_or_none, flight_id)
+
+        results = await asyncio.gather(*(fetch(flight_id) for flight_id in flight_ids))
+        return dict(zip(flight_ids, results))
+
+    def clear_cache(self):
+        """Remove all cached API responses."""
+        with self._cache_lock:
+            self._response_cache.clear()
+
+    def enhanced_plot_flight(self, sorted_tracks, flight_id, fig_filename=None, orientation='horizontal', pad_factor=0.2, zoom=None, background='carto', flight_number=None, origin=None, destination=None, skip_basemap=False, dpi=300, simplify_tolerance_m=None, png_compress_level=None):
+        """
+        Enhanced plot of flight data using pyproj and contextily.
+        Reprojects the track points to Web Mercator, adds a basemap and plots a connecting line.
         
         Args:
-            sorted_tracks: List of track points
+            sorted_tracks: List of track points or a DataFrame with lon and lat columns
             flight_id: Flight identifier
             fig_filename: Output filename for the plot
             orientation: Plot orientation ('horizontal', 'vertical', or 'auto'). 
@@ -401,42 +961,47 @@ class FR24API:
             pad_factor: Padding around the flight path
             zoom: Zoom level for the basemap (if None, will be automatically determined)
             background: Background map provider ('carto', 'osm', 'stamen', 'esri')
+            skip_basemap: Draw the flight path without downloading basemap tiles (default: False)
+            dpi: Resolution of the saved image in dots per inch (default: 300)
+            png_compress_level: zlib level from 0 to 9 for the saved PNG (default: None, Pillow's default).
+                       Lower levels save faster but write larger files.
+            simplify_tolerance_m: Tolerance in meters used to simplify the drawn path
+                                  (default: None, which draws every track point)
         """
-        self.logger.debug(f"Starting enhanced_plot_flight with {len(sorted_tracks)} track points")
+        _configure_font()
+
+        self.logger.debug("Starting enhanced_plot_flight with %d track points", len(sorted_tracks))
         
-        # Convert track data to DataFrame then to GeoDataFrame
+        # Convert track data to DataFrame
         df = pd.DataFrame(sorted_tracks)
         if df.empty:
             self.logger.warning("No data available to plot.")
             return
             
-        self.logger.debug(f"DataFrame created with columns: {df.columns.tolist()}")
+        self.logger.debug("DataFrame created with columns: %s", df.columns.tolist())
         
-        # Create geometry column from lon, lat and set CRS to EPSG:4326.
-        try:
-            gdf = gpd.GeoDataFrame(df, geometry=gpd.points_from_xy(df.lon, df.lat), crs="EPSG:4326")
-            self.logger.debug("GeoDataFrame created successfully")
-        except Exception as e:
-            self.logger.error(f"Error creating GeoDataFrame: {e}")
-            return
-            
-        # Reproject to Web Mercator.
+        # Reproject lon/lat straight to Web Mercator arrays in one vectorized call.
         try:
-            gdf_plot = gdf.to_crs(epsg=3857)
+            lon, lat = df["lon"].to_numpy(dtype=float), df["lat"].to_numpy(dtype=float)
+            if simplify_tolerance_m:
+                # Long tracks have far more points than the image can show
+                keep = _simplify_path(lon, lat, simplify_tolerance_m)
+                lon, lat = lon[keep], lat[keep]
+                self.logger.debug("Simplified plotted path from %d to %d points", len(df), len(lon))
+            xs, ys = _get_web_mercator_transformer().transform(lon, lat)
             self.logger.debug("Data reprojected to Web Mercator")
         except Exception as e:
             self.logger.error(f"Error reprojecting data: {e}")
             return
+        xmin, ymin, xmax, ymax = np.nanmin(xs), np.nanmin(ys), np.nanmax(xs), np.nanmax(ys)
 
         # Determine orientation if 'auto'
         if orientation == 'auto':
-            # Get the bounding box
-            xmin, ymin, xmax, ymax = gdf_plot.total_bounds
             width = xmax - xmin
             height = ymax - ymin
             # Choose orientation based on which dimension is larger
             orientation = 'horizontal' if width > height else 'vertical'
-            self.logger.debug(f"Auto-detected orientation: {orientation}")
+            self.logger.debug("Auto-detected orientation: %s", orientation)
 
         # Set figure size based on orientation
         if orientation == 'vertical':
@@ -444,17 +1009,20 @@ class FR24API:
         else:  # horizontal
             figsize = (16, 9)
         
-        # Create figure and axis with appropriate aspect ratio
-        fig, ax = plt.subplots(figsize=figsize)
+        # Create figure and axis with appropriate aspect ratio. Without a file name the
+        # figure is left open in pyplot so the caller can show it.
+        if fig_filename:
+            fig, ax = _new_figure(figsize)
+        else:
+            fig, ax = _get_pyplot().subplots(figsize=figsize)
         
         # Plot only the connecting line in orange (#f18851) without any points
         self.logger.debug("Plotting connecting line")
-        ax.plot(gdf_plot.geometry.x, gdf_plot.geometry.y, color="#f18851", linewidth=2, solid_capstyle='round', solid_joinstyle='round')
+        ax.plot(xs, ys, color="#f18851", linewidth=2, solid_capstyle='round', solid_joinstyle='round')
         
         # Expand plot bounds for context.
         try:
-            xmin, ymin, xmax, ymax = gdf_plot.total_bounds
-            self.logger.debug(f"Plot bounds: xmin={xmin}, ymin={ymin}, xmax={xmax}, ymax={ymax}")
+            self.logger.debug("Plot bounds: xmin=%s, ymin=%s, xmax=%s, ymax=%s", xmin, ymin, xmax, ymax)
             x_pad = (xmax - xmin) * pad_factor
             y_pad = (ymax - ymin) * pad_factor
             extent = [xmin - x_pad, ymin - y_pad, xmax + x_pad, ymax + y_pad]
@@ -468,49 +1036,53 @@ class FR24API:
             return
         
         # Add a basemap based on the selected provider
-        try:
-            # If zoom is None, don't pass it to add_basemap
-            basemap_kwargs = {'reset_extent': False}
-            if zoom is not None:
-                basemap_kwargs['zoom'] = zoom
-                
-            # Map user-friendly names to contextily providers
-            source_map = {
-                'carto-light': ctx.providers.CartoDB.Positron,
-                'carto-dark': ctx.providers.CartoDB.DarkMatter,
-                'osm': ctx.providers.OpenStreetMap.Mapnik,
-                'esri-topo': ctx.providers.Esri.WorldTopoMap,
-                'esri-satellite': ctx.providers.Esri.WorldImagery
-            }
-            # Get the source, defaulting to 'carto-light' if not found
-            source = source_map.get(background.lower(), ctx.providers.CartoDB.Positron)
-            ctx.add_basemap(ax, source=source, **basemap_kwargs)
-            self.logger.debug(f"Basemap added with provider: {background}")
-
+        if not skip_basemap:
+            try:
+                ctx = _get_contextily()
 
-        except Exception as e:
-            self.logger.error(f"Error adding basemap: {e}")
-            return
+                # If zoom is None, don't pass it to add_basemap
+                basemap_kwargs = {'reset_extent': False}
+                if zoom is not None:
+                    basemap_kwargs['zoom'] = zoom
+                
+                # Map user-friendly names to contextily providers
+                source_map = {
+                    'carto-light': ctx.providers.CartoDB.Positron,
+                    'carto-dark': ctx.providers.CartoDB.DarkMatter,
+                    'osm': ctx.providers.OpenStreetMap.Mapnik,
+                    'esri-topo': ctx.providers.Esri.WorldTopoMap,
+                    'esri-satellite': ctx.providers.Esri.WorldImagery
+                }
+                # Get the source, defaulting to 'carto-light' if not found
+                source = source_map.get(background.lower(), ctx.providers.CartoDB.Positron)
+                ctx.add_basemap(ax, source=source, **basemap_kwargs)
+                self.logger.debug("Basemap added with provider: %s", background)
+            except Exception as e:
+                self.logger.error(f"Error adding basemap: {e}")
+                return
         
         ax.set_axis_off()
-        plt.tight_layout()
+        fig.tight_layout()
         # Create a more descriptive title
         if flight_number and origin and destination:
             title = f"Flight: {flight_number}  Departure: {origin}  Destination: {destination}"
         else:
             title = f"Flight: {flight_id}"
-        plt.title(title)
+        ax.set_title(title)
         
         if fig_filename:
             try:
-                os.makedirs(os.path.dirname(fig_filename), exist_ok=True)
-                plt.savefig(fig_filename, dpi=300, bbox_inches="tight", pad_inches=0)
+                # export_flight_data has already made the directory; direct callers may not have
+                fig_dir = os.path.dirname(fig_filename)
+                if fig_dir:
+                    os.makedirs(fig_dir, exist_ok=True)
+                fig.savefig(fig_filename, dpi=dpi, bbox_inches="tight", pad_inches=0, pil_kwargs=_png_options(png_compress_level))
                 self.logger.info(f"Plot saved as {fig_filename}")
             except Exception as e:
                 self.logger.error(f"Error saving plot: {e}")
                 return
 
-    def export_flight_data(self, flight_id, output_dir=None, background='carto', orientation='horizontal', timezone=None, flight_number=None, origin=None, destination=None):
+    def export_flight_data(self, flight_id, output_dir=None, background='carto', orientation='horizontal', timezone=None, flight_number=None, origin=None, destination=None, simplify_tolerance_m=50, skip_basemap=False, dpi=300, png_compress_level=None):
         """
         Export flight track data to CSV, GeoJSON (points and line), KML and visualizations.
         Creates a directory named data/flight_id (or specified output_dir) and saves:
@@ -521,15 +1093,22 @@ class FR24API:
           - map.png: A map visualization of the flight path.
           - speed.png: A line chart of speed over time.
           - altitude.png: A line chart of altitude over time.
-          
+
         Args:
             flight_id: Flight identifier
             output_dir: Output directory path
             background: Background map provider ('carto', 'osm', 'stamen', 'esri')
-            orientation: Plot orientation ('horizontal', 'vertical', or 'auto'). 
+            orientation: Plot orientation ('horizontal', 'vertical', or 'auto').
                        'horizontal' uses 16:9 aspect ratio (default)
                        'vertical' uses 9:16 aspect ratio
                        'auto' will choose based on the flight path direction
+            simplify_tolerance_m: Tolerance in meters used to simplify the flight path in
+                       line.geojson, track.kml and map.png (default: 50). data.csv and
+                       points.geojson always keep every track point. Use 0 to disable.
+            skip_basemap: Draw map.png without downloading basemap tiles (default: False)
+            dpi: Resolution of map.png, speed.png and altitude.png in dots per inch (default: 300)
+            png_compress_level: zlib level from 0 to 9 for the PNG files (default: None, Pillow's default).
+                       Level 1 saves faster but writes files about twice as large.
         """
         # Fetch flight tracks.
         self.logger.info(f"Fetching flight tracks for flight ID: {flight_id}")
@@ -558,14 +1137,12 @@ class FR24API:
             try:
                 target_tz = ZoneInfo(timezone)
                 self.logger.info(f"Converting timestamps to timezone: {timezone}")
-                for track in sorted_tracks:
-                    if ts_str := track.get("timestamp"):
-                        dt_obj = pd.to_datetime(ts_str)
-                        if dt_obj.tzinfo is None:
-                            dt_obj = dt_obj.tz_localize('UTC')
-                        
-                        local_dt = dt_obj.astimezone(target_tz)
-                        track['timestamp'] = local_dt.isoformat()
+                # Convert copies so cached track data is left untouched
+                sorted_tracks = [dict(track) for track in sorted_tracks]
+                timed = [track for track in sorted_tracks if track.get("timestamp")]
+                local_times = _convert_timestamps([track["timestamp"] for track in timed], target_tz)
+                for track, local_time in zip(timed, local_times):
+                    track['timestamp'] = local_time
             except ZoneInfoNotFoundError:
                 self.logger.warning(f"Timezone '{timezone}' not found. Skipping conversion.")
             except Exception as e:
@@ -577,24 +1154,21 @@ class FR24API:
         os.makedirs(output_dir, exist_ok=True)
         self.logger.info(f"Exporting flight data to directory: {output_dir}")
 
+        # Convert the tracks once into columns shared by every export below.
+        # Object dtype keeps the original values so they are written unchanged.
+        df = pd.DataFrame(sorted_tracks, dtype=object)
+        df = df.reindex(columns=list(dict.fromkeys([*df.columns, *_CSV_FIELDNAMES])))
+        lon = df["lon"].to_numpy(dtype=float)
+        lat = df["lat"].to_numpy(dtype=float)
+
         # Export CSV.
         csv_file = os.path.join(output_dir, "data.csv")
-        fieldnames = ["timestamp", "lat", "lon", "alt", "gspeed", "vspeed", "track", "squawk", "callsign", "source"]
-        with open(csv_file, mode="w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for track in sorted_tracks:
-                row = {k: track.get(k, "") for k in fieldnames}
-                writer.writerow(row)
+        df.to_csv(csv_file, columns=_CSV_FIELDNAMES, index=False, lineterminator="\r\n")
         self.logger.info(f"CSV data saved to {csv_file}")
 
         # Export GeoJSON points.
-        points_geojson = {
-            "type": "FeatureCollection",
-            "features": []
-        }
-        for track in sorted_tracks:
-            feature = {
+        point_features = (
+            {
                 "type": "Feature",
                 "geometry": {
                     "type": "Point",
@@ -602,19 +1176,18 @@ class FR24API:
                 },
                 "properties": track
             }
-            points_geojson["features"].append(feature)
+            for track in sorted_tracks
+        )
         points_file = os.path.join(output_dir, "points.geojson")
-        with open(points_file, "w") as f:
-            json.dump(points_geojson, f, indent=2)
+        _write_feature_collection(point_features, points_file)
         self.logger.info(f"GeoJSON points saved to {points_file}")
 
+        # Simplify the path used for the line, KML and map outputs.
+        path_df = df[_simplify_path(lon, lat, simplify_tolerance_m)]
+        self.logger.debug("Simplified path from %d to %d points", len(df), len(path_df))
+
         # Export GeoJSON linestring.
-        coordinates = []
-        for track in sorted_tracks:
-            lon = track.get("lon")
-            lat = track.get("lat")
-            if lon is not None and lat is not None:
-                coordinates.append([lon, lat])
+        coordinates = path_df[["lon", "lat"]].to_numpy().tolist()
         line_geojson = {
             "type": "FeatureCollection",
             "features": [{
@@ -627,103 +1200,114 @@ class FR24API:
             }]
         }
         line_file = os.path.join(output_dir, "line.geojson")
-        with open(line_file, "w") as f:
-            json.dump(line_geojson, f, indent=2)
+        _write_json(line_geojson, line_file)
         self.logger.info(f"GeoJSON line saved to {line_file}")
 
         # Export KML
-        kml_content = _create_kml_from_tracks(sorted_tracks, flight_id)
+        kml_content = _create_kml_from_tracks(path_df, flight_id)
         kml_file = os.path.join(output_dir, "track.kml")
         with open(kml_file, "w") as f:
             f.write(kml_content)
         self.logger.info(f"KML file saved to {kml_file}")
 
-        # Create map visualization
-        map_file = os.path.join(output_dir, "map.png")
-        self.enhanced_plot_flight(sorted_tracks, flight_id, fig_filename=map_file, background=background, orientation=orientation, flight_number=flight_number, origin=origin, destination=destination)
-        
-        # Create speed chart
-        speed_file = os.path.join(output_dir, "speed.png")
-        self._plot_speed_chart(sorted_tracks, flight_id, speed_file, flight_number=flight_number, origin=origin, destination=destination)
-        
-        # Create altitude chart
-        altitude_file = os.path.join(output_dir, "altitude.png")
-        self._plot_altitude_chart(sorted_tracks, flight_id, altitude_file, flight_number=flight_number, origin=origin, destination=destination)
+        # Plot styles live in matplotlib's global rcParams, so only one thread may draw at a time
+        with _PLOT_LOCK:
+            # Create map visualization
+            map_file = os.path.join(output_dir, "map.png")
+            self.enhanced_plot_flight(path_df, flight_id, fig_filename=map_file, background=background, orientation=orientation, flight_number=flight_number, origin=origin, destination=destination, skip_basemap=skip_basemap, dpi=dpi, png_compress_level=png_compress_level)
+
+            # Create speed chart
+            speed_file = os.path.join(output_dir, "speed.png")
+            self._plot_speed_chart(df, flight_id, speed_file, flight_number=flight_number, origin=origin, destination=destination, dpi=dpi, png_compress_level=png_compress_level)
+
+            # Create altitude chart
+            altitude_file = os.path.join(output_dir, "altitude.png")
+            self._plot_altitude_chart(df, flight_id, altitude_file, flight_number=flight_number, origin=origin, destination=destination, dpi=dpi, png_compress_level=png_compress_level)
 
         return output_dir
 
-    def _plot_speed_chart(self, tracks, flight_id, output_file, flight_number=None, origin=None, destination=None):
-        """Create a line chart of speed over time."""
-        # Extract timestamps and speeds
-        timestamps = []
-        speeds = []
-        self.logger.debug(f"Processing {len(tracks)} track points for speed chart")
-        
-        for i, track in enumerate(tracks):
+    def bulk_export(self, flight_ids, output_root="data", max_workers=8, **kwargs):
+        """
+        Export several flights concurrently.
+
+        Each flight is exported with export_flight_data in a thread pool, so API
+        requests and file writes for different flights overlap. Plots are drawn
+        with Agg outside pyplot, one flight at a time, so any matplotlib backend works.
+        A flight that fails for any reason is logged and does not stop the others.
+
+        Args:
+            flight_ids: List of flight identifiers
+            output_root: Directory that will hold one subdirectory per flight (default: data)
+            max_workers: Maximum number of flights exported at the same time (default: 8)
+            **kwargs: Additional arguments passed to export_flight_data
+
+        Returns:
+            dict: Output directory for each flight ID, or None if the export failed
+        """
+        def export(flight_id):
             try:
-                self.logger.debug(f"Track point {i}: {track}")
-                
-                # Skip if timestamp is missing or None
-                if 'timestamp' not in track or track['timestamp'] is None:
-                    self.logger.debug(f"Skipping track {i}: missing or None timestamp")
-                    continue
-                    
-                timestamp = pd.to_datetime(track['timestamp'])
-                
-                # Handle missing or None speed values
-                if 'gspeed' not in track or track['gspeed'] is None:
-                    speed = 0  # Assume zero speed when data is missing
-                    self.logger.debug(f"Track {i}: using zero speed for missing data")
-                else:
-                    speed = float(track['gspeed'])
-                
-                # Skip only if speed is negative or unreasonably high
-                if speed < 0 or speed > 1000:  # 1000 knots is a reasonable upper limit
-                    self.logger.debug(f"Skipping track {i}: invalid speed value {speed}")
-                    continue
-                    
-                timestamps.append(timestamp)
-                speeds.append(speed)
-                self.logger.debug(f"Added track point {i}: timestamp={timestamp}, speed={speed}")
-            except (ValueError, TypeError) as e:
-                self.logger.debug(f"Skipping track {i}: error processing data - {e}")
-                continue
-
-        if not timestamps:
-            self.logger.warning("No valid speed data available for plotting")
+                return self.export_flight_data(flight_id, output_dir=os.path.join(output_root, flight_id), **kwargs)
+            except Exception as e:
+                # API errors, and also OSErrors from writing files, only fail this flight
+                self.logger.error(f"Error exporting flight {flight_id}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(flight_ids, executor.map(export, flight_ids)))
+
+    def _plot_time_series(self, tracks, column, upper, name, title, subhead, tick_format,
+                          flight_id, output_file, flight_number=None, origin=None, destination=None, dpi=300, png_compress_level=None):
+        """
+        Create a line chart of one track field over time.
+
+        Args:
+            tracks: List of track points or a DataFrame of them
+            column: Track field to plot (e.g. 'gspeed' or 'alt')
+            upper: Largest plausible value for the field
+            name: Short name of the chart used in log messages (e.g. 'speed')
+            title: Start of the headline (e.g. 'Ground speed profile')
+            subhead: Subtitle describing the units
+            tick_format: Format spec for y-axis tick labels (e.g. ',')
+            flight_id: Flight ID, used in the headline when route details are missing
+            output_file: Path to save the PNG to
+            flight_number: Optional flight number for the headline
+            origin: Optional origin airport for the headline
+            destination: Optional destination airport for the headline
+            dpi: Resolution of the saved image
+            png_compress_level: zlib level for the saved PNG, or None for Pillow's default
+        """
+        import matplotlib.style
+        import matplotlib.dates as mdates
+        from matplotlib.artist import setp
+        from matplotlib.ticker import FuncFormatter
+        _configure_font()
+
+        timestamps, values = _chart_series(tracks, column, upper)
+        self.logger.debug("Kept %d of %d track points for %s chart", len(timestamps), len(tracks), name)
+
+        if not len(timestamps):
+            self.logger.warning(f"No valid {name} data available for plotting")
             return
 
-        self.logger.debug(f"Creating speed chart with {len(timestamps)} points")
+        self.logger.debug("Creating %s chart with %d points", name, len(timestamps))
         
         # Use a clean, professional style
-        plt.style.use('default')
+        matplotlib.style.use('default')
         
         # Create the plot with larger figure size
-        fig, ax = plt.subplots(figsize=(16, 9))
+        fig, ax = _new_figure((16, 9))
         
-        # Plot the speed data with a clean orange line
-        ax.plot(timestamps, speeds, color='#f18851', linewidth=2, alpha=0.9)
+        # Plot the data with a clean orange line
+        ax.plot(timestamps, values, color='#f18851', linewidth=2, alpha=0.9)
+        
+        # Create title with human-readable date from the first timestamp
+        flight_date = timestamps[0].strftime('%B %-d, %Y')
         
-        # Create title with human-readable date
-        if timestamps:
-            # Get the date from the first timestamp for the title
-            first_timestamp = timestamps[0]
-            if hasattr(first_timestamp, 'strftime'):
-                flight_date = first_timestamp.strftime('%B %-d, %Y')
-            else:
-                flight_date = str(first_timestamp)[:10]
-        else:
-            flight_date = ""
-            
         # Create headline and subhead structure
-        if flight_number and origin and destination and flight_date:
-            headline = f"Ground speed profile for {flight_number} from {origin} to {destination} on {flight_date}"
-        elif flight_number and origin and destination:
-            headline = f"Ground speed profile for {flight_number} from {origin} to {destination}"
+        if flight_number and origin and destination:
+            headline = f"{title} for {flight_number} from {origin} to {destination} on {flight_date}"
         else:
-            headline = f"Ground speed profile for flight {flight_id}"
-            
-        subhead = "Ground speed in knots"
+            headline = f"{title} for flight {flight_id}"
         
         # Set main title (headline) - bold, larger font, positioned very close to Y-axis
         ax.text(-0.04, 1.15, headline, transform=ax.transAxes, fontsize=16, 
@@ -746,26 +1330,19 @@ class FR24API:
         ax.grid(True, linestyle='-', alpha=0.15, color='#cccccc')
         
         # Format x-axis with clean time format using timezone from data
-        tz = None
-        if timestamps and hasattr(timestamps[0], 'tz') and timestamps[0].tz is not None:
-            tz = timestamps[0].tz
+        tz = timestamps.tz
         
         # Smart time interval selection based on flight duration
-        if timestamps:
-            duration_hours = (timestamps[-1] - timestamps[0]).total_seconds() / 3600
-            if duration_hours <= 8:  # Short to medium flights: 30-minute intervals
-                ax.xaxis.set_major_locator(mdates.MinuteLocator(byminute=[0, 30], tz=tz))
-                ax.xaxis.set_major_formatter(mdates.DateFormatter('%-I:%M %p', tz=tz))
-            else:  # Long flights: 1-hour intervals
-                ax.xaxis.set_major_locator(mdates.HourLocator(interval=1, tz=tz))
-                ax.xaxis.set_major_formatter(mdates.DateFormatter('%-I %p', tz=tz))
-        else:
-            # Fallback to hourly
+        duration_hours = (timestamps[-1] - timestamps[0]).total_seconds() / 3600
+        if duration_hours <= 8:  # Short to medium flights: 30-minute intervals
+            ax.xaxis.set_major_locator(mdates.MinuteLocator(byminute=[0, 30], tz=tz))
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%-I:%M %p', tz=tz))
+        else:  # Long flights: 1-hour intervals
             ax.xaxis.set_major_locator(mdates.HourLocator(interval=1, tz=tz))
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%-I %p', tz=tz))
         
         # Clean x-axis labels
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=0, ha='center', fontsize=12, color='#666666')
+        setp(ax.xaxis.get_majorticklabels(), rotation=0, ha='center', fontsize=12, color='#666666')
         
         # Add timezone indicator to x-axis
         if tz:
@@ -786,8 +1363,8 @@ class FR24API:
                     fontfamily='sans-serif')
         
         # Format y-axis labels cleanly (units are in the title)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x)}'))
-        plt.setp(ax.yaxis.get_majorticklabels(), fontsize=12, color='#666666')
+        ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: format(int(x), tick_format)))
+        setp(ax.yaxis.get_majorticklabels(), fontsize=12, color='#666666')
         
         # Clean up the appearance
         ax.spines['top'].set_visible(False)
@@ -796,176 +1373,143 @@ class FR24API:
         ax.spines['bottom'].set_color('#cccccc')
         
         # Adjust layout to accommodate custom titles positioned higher above chart area
-        plt.subplots_adjust(top=0.78)
+        fig.subplots_adjust(top=0.78)
         
         # Save the plot with higher DPI
-        plt.savefig(output_file, dpi=300, bbox_inches="tight")
-        plt.close()
-        self.logger.info(f"Speed chart saved to {output_file}")
+        fig.savefig(output_file, dpi=dpi, bbox_inches="tight", pil_kwargs=_png_options(png_compress_level))
+        self.logger.info(f"{name.capitalize()} chart saved to {output_file}")
+
+    def _plot_speed_chart(self, tracks, flight_id, output_file, flight_number=None, origin=None, destination=None, dpi=300, png_compress_level=None):
+        """Create a line chart of speed over time."""
+        self._plot_time_series(tracks, "gspeed", 1000, "speed", "Ground speed profile", "Ground speed in knots", "",
+                               flight_id, output_file, flight_number, origin, destination, dpi, png_compress_level)
 
-    def _plot_altitude_chart(self, tracks, flight_id, output_file, flight_number=None, origin=None, destination=None):
+    def _plot_altitude_chart(self, tracks, flight_id, output_file, flight_number=None, origin=None, destination=None, dpi=300, png_compress_level=None):
         """Create a line chart of altitude over time."""
-        # Extract timestamps and altitudes
-        timestamps = []
-        altitudes = []
-        self.logger.debug(f"Processing {len(tracks)} track points for altitude chart")
-        
-        for i, track in enumerate(tracks):
-            try:
-                self.logger.debug(f"Track point {i}: {track}")
-                
-                # Skip if timestamp is missing or None
-                if 'timestamp' not in track or track['timestamp'] is None:
-                    self.logger.debug(f"Skipping track {i}: missing or None timestamp")
-                    continue
-                    
-                timestamp = pd.to_datetime(track['timestamp'])
-                
-                # Handle missing or None altitude values
-                if 'alt' not in track or track['alt'] is None:
-                    alt = 0  # Assume ground level when data is missing
-                    self.logger.debug(f"Track {i}: using zero altitude for missing data")
-                else:
-                    alt = float(track['alt'])
-                
-                # Skip only if altitude is negative or unreasonably high
-                if alt < 0 or alt > 50000:  # 50,000 feet is a reasonable upper limit
-                    self.logger.debug(f"Skipping track {i}: invalid altitude value {alt}")
-                    continue
-                    
-                timestamps.append(timestamp)
-                altitudes.append(alt)
-                self.logger.debug(f"Added track point {i}: timestamp={timestamp}, altitude={alt}")
-            except (ValueError, TypeError) as e:
-                self.logger.debug(f"Skipping track {i}: error processing data - {e}")
-                continue
-
-        if not timestamps:
-            self.logger.warning("No valid altitude data available for plotting")
-            return
+        self._plot_time_series(tracks, "alt", 50000, "altitude", "Altitude profile", "Altitude in feet", ",",
+                               flight_id, output_file, flight_number, origin, destination, dpi, png_compress_level)
 
-        self.logger.debug(f"Creating altitude chart with {len(timestamps)} points")
-        
-        # Use a clean, professional style
-        plt.style.use('default')
-        
-        # Create the plot with larger figure size
-        fig, ax = plt.subplots(figsize=(16, 9))
-        
-        # Plot the altitude data with a clean orange line
-        ax.plot(timestamps, altitudes, color='#f18851', linewidth=2, alpha=0.9)
-        
-        # Create title with human-readable date
-        if timestamps:
-            # Get the date from the first timestamp for the title
-            first_timestamp = timestamps[0]
-            if hasattr(first_timestamp, 'strftime'):
-                flight_date = first_timestamp.strftime('%B %-d, %Y')
-            else:
-                flight_date = str(first_timestamp)[:10]
-        else:
-            flight_date = ""
-            
-        # Create headline and subhead structure
-        if flight_number and origin and destination and flight_date:
-            headline = f"Altitude profile for {flight_number} from {origin} to {destination} on {flight_date}"
-        elif flight_number and origin and destination:
-            headline = f"Altitude profile for {flight_number} from {origin} to {destination}"
-        else:
-            headline = f"Altitude profile for flight {flight_id}"
-            
-        subhead = "Altitude in feet"
-        
-        # Set main title (headline) - bold, larger font, positioned very close to Y-axis
-        ax.text(-0.04, 1.15, headline, transform=ax.transAxes, fontsize=16, 
-                weight='bold', color='#333333', ha='left', va='top',
-                fontfamily='sans-serif')
-        
-        # Set subtitle - italic, smaller font, positioned very close to Y-axis
-        ax.text(-0.04, 1.09, subhead, transform=ax.transAxes, fontsize=12,
-                style='italic', color='#666666', ha='left', va='top',
-                fontfamily='sans-serif')
-        
-        # Remove the default title
-        ax.set_title("")
-        
-        # Remove axis labels - title explains what we're showing
-        ax.set_xlabel("")
-        ax.set_ylabel("")
-        
-        # Clean, minimal grid
-        ax.grid(True, linestyle='-', alpha=0.15, color='#cccccc')
-        
-        # Format x-axis with clean time format using timezone from data
-        tz = None
-        if timestamps and hasattr(timestamps[0], 'tz') and timestamps[0].tz is not None:
-            tz = timestamps[0].tz
-        
-        # Smart time interval selection based on flight duration
-        if timestamps:
-            duration_hours = (timestamps[-1] - timestamps[0]).total_seconds() / 3600
-            if duration_hours <= 8:  # Short to medium flights: 30-minute intervals
-                ax.xaxis.set_major_locator(mdates.MinuteLocator(byminute=[0, 30], tz=tz))
-                ax.xaxis.set_major_formatter(mdates.DateFormatter('%-I:%M %p', tz=tz))
-            else:  # Long flights: 1-hour intervals
-                ax.xaxis.set_major_locator(mdates.HourLocator(interval=1, tz=tz))
-                ax.xaxis.set_major_formatter(mdates.DateFormatter('%-I %p', tz=tz))
-        else:
-            # Fallback to hourly
-            ax.xaxis.set_major_locator(mdates.HourLocator(interval=1, tz=tz))
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%-I %p', tz=tz))
-        
-        # Clean x-axis labels
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=0, ha='center', fontsize=12, color='#666666')
-        
-        # Add timezone indicator to x-axis
-        if tz:
-            tz_name = str(tz).replace('UTC', '').replace('+', '').replace('-', '-')
-            if 'America/New_York' in str(tz) or '-04:00' in tz_name or '-05:00' in tz_name:
-                tz_label = "Eastern Time"
-            elif 'America/Chicago' in str(tz) or '-05:00' in tz_name or '-06:00' in tz_name:
-                tz_label = "Central Time"
-            elif 'America/Denver' in str(tz) or '-06:00' in tz_name or '-07:00' in tz_name:
-                tz_label = "Mountain Time"
-            elif 'America/Los_Angeles' in str(tz) or '-07:00' in tz_name or '-08:00' in tz_name:
-                tz_label = "Pacific Time"
-            else:
-                tz_label = f"Time ({tz_name})"
-            
-            ax.text(0.98, 0.02, tz_label, transform=ax.transAxes, fontsize=10,
-                    color='#666666', ha='right', va='bottom', style='italic',
-                    fontfamily='sans-serif')
-        
-        # Format y-axis labels with comma separators (units are in the title)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x):,}'))
-        plt.setp(ax.yaxis.get_majorticklabels(), fontsize=12, color='#666666')
-        
-        # Clean up the appearance
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_color('#cccccc')
-        ax.spines['bottom'].set_color('#cccccc')
-        
-        # Adjust layout to accommodate custom titles positioned higher above chart area
-        plt.subplots_adjust(top=0.78)
-        
-        # Save the plot with higher DPI
-        plt.savefig(output_file, dpi=300, bbox_inches="tight")
-        plt.close()
-        self.logger.info(f"Altitude chart saved to {output_file}")
+    def _fetch_flight_ids_page(self, params, offset):
+        """
+        Fetch one page of flight IDs.
+
+        Args:
+            params: Query parameters shared by every page
+            offset: Offset of the first result on the page
+
+        Returns:
+            list: Flight IDs on the page
+        """
+        url = "https://fr24api.flightradar24.com/api/flight-ids"
+        # Past date ranges don't change, but ranges reaching today gain new flights
+        today = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d")
+        ttl = 60 if params["date_to"][:10] >= today else 86400
+        key = ("flight-ids", params["registration"].strip().upper(), params["date_from"], params["date_to"], params["limit"], offset)
+        data = self._cached_request(key, url, {**params, "offset": offset}, ttl=ttl)
+        items = data.get("data", []) if isinstance(data, dict) else data
+        return [item.get("fr24_id") if isinstance(item, dict) else item for item in items]
+
+    def iter_flight_ids_by_registration(self, registration, date_from, date_to, offset=0, limit=20, max_pages=5, max_workers=8):
+        """
+        Iterate over flight IDs for an aircraft registration within a date range.
+
+        IDs from the first page are yielded before any other page is requested,
+        so callers that stop early skip the remaining requests. If the first
+        page is full, the pages after it up to max_pages are fetched
+        concurrently and yielded in page order.
+
+        Args:
+            registration: Aircraft registration
+            date_from: Start date
+            date_to: End date
+            offset: Offset of the first result (default: 0)
+            limit: Number of results per page (default: 20)
+            max_pages: Maximum number of pages to fetch (default: 5)
+            max_workers: Maximum number of pages fetched at the same time (default: 8)
 
-    def get_flight_ids_by_registration(self, registration, date_from, date_to, offset=0, limit=20, max_pages=5):
-        # Get flight IDs for an aircraft registration within a date range.
-        url = f"https://fr24api.flightradar24.com/api/flight-ids"
+        Yields:
+            str: Flight IDs in page order, without duplicates
+        """
         params = {
             "registration": registration,
             "date_from": self._validate_and_format_date(date_from),
             "date_to": self._validate_and_format_date(date_to),
-            "offset": offset,
             "limit": limit
         }
-        response = self._make_request("get", url, headers=self.session.headers, params=params)
-        return response.json()
+        seen = set()
+
+        first_page = self._fetch_flight_ids_page(params, offset)
+        for flight_id in first_page:
+            if flight_id not in seen:
+                seen.add(flight_id)
+                yield flight_id
+
+        # A short first page means there is nothing more to fetch
+        if len(first_page) < limit or max_pages <= 1:
+            return
+
+        offsets = [offset + limit * page for page in range(1, max_pages)]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets))) as executor:
+            futures = [executor.submit(self._fetch_flight_ids_page, params, page_offset) for page_offset in offsets]
+            try:
+                for future in futures:
+                    for flight_id in future.result():
+                        if flight_id not in seen:
+                            seen.add(flight_id)
+                            yield flight_id
+            finally:
+                # Don't start pages nobody will read if the caller stopped early
+                for future in futures:
+                    future.cancel()
+
+    def get_flight_ids_by_registration(self, registration, date_from, date_to, offset=0, limit=20, max_pages=5, max_workers=8):
+        """
+        Get flight IDs for an aircraft registration within a date range.
+
+        Collects iter_flight_ids_by_registration into a list.
+
+        Args:
+            registration: Aircraft registration
+            date_from: Start date
+            date_to: End date
+            offset: Offset of the first result (default: 0)
+            limit: Number of results per page (default: 20)
+            max_pages: Maximum number of pages to fetch (default: 5)
+            max_workers: Maximum number of pages fetched at the same time (default: 8)
+
+        Returns:
+            list: Flight IDs in page order, without duplicates
+        """
+        flight_ids = list(self.iter_flight_ids_by_registration(
+            registration, date_from, date_to, offset=offset, limit=limit, max_pages=max_pages, max_workers=max_workers
+        ))
+        self.logger.debug("Found %d flight IDs for %s", len(flight_ids), registration)
+        return flight_ids
+
+    def get_flight_ids_by_registrations(self, registrations, date_from, date_to, registration_workers=4, **kwargs):
+        """
+        Get flight IDs for several aircraft registrations concurrently.
+
+        Args:
+            registrations: List of aircraft registrations
+            date_from: Start date
+            date_to: End date
+            registration_workers: Maximum number of registrations looked up at the same time (default: 4)
+            **kwargs: Additional arguments passed to get_flight_ids_by_registration, including
+                      max_workers for the pages fetched at the same time per registration
+
+        Returns:
+            dict: List of flight IDs for each registration, or None if the lookup failed
+        """
+        def lookup(registration):
+            try:
+                return self.get_flight_ids_by_registration(registration, date_from, date_to, **kwargs)
+            except FR24Error as e:
+                self.logger.error(f"Error fetching flight IDs for {registration}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=registration_workers) as executor:
+            return dict(zip(registrations, executor.map(lookup, registrations)))
 
     def smart_export_flight(
         self,
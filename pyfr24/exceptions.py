@@ -11,8 +11,14 @@ class FR24AuthenticationError(FR24Error):
     pass
 
 class FR24RateLimitError(FR24Error):
-    """Exception raised when rate limit is exceeded."""
-    pass
+    """Exception raised when rate limit is exceeded.
+
+    Attributes:
+        retry_after: Seconds the server asked to wait before retrying, or None if it didn't say
+    """
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 class FR24NotFoundError(FR24Error):
     """Exception raised when a resource is not found."""
@@ -4,8 +4,13 @@ Logging configuration for the Flightradar24 API client.
 
 import logging
 import sys
+import threading
 from logging.handlers import RotatingFileHandler
 
+# Arguments and handlers of the last configure_logging call
+_CONFIG_LOCK = threading.Lock()
+_current_config = None
+
 def configure_logging(level=logging.WARNING, log_file=None, log_format=None):
     """
     Configure logging for the Flightradar24 API client.
@@ -18,16 +23,41 @@ def configure_logging(level=logging.WARNING, log_file=None, log_format=None):
     Returns:
         Logger instance
     """
+    global _current_config
+
     # Get the logger
     logger = logging.getLogger('pyfr24')
-    
-    # Set the log level
-    logger.setLevel(level)
-    
-    # Remove existing handlers
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-    
+
+    with _CONFIG_LOCK:
+        # Set the log level
+        logger.setLevel(level)
+
+        # Keep the handlers from an identical earlier call that are still in place
+        config = (level, log_file, log_format, sys.stdout)
+        if _current_config is not None and _current_config[0] == config and logger.handlers == _current_config[1]:
+            return logger
+
+        # Remove existing handlers, closing our own so log files are released
+        ours = _current_config[1] if _current_config is not None else []
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            if handler in ours:
+                handler.close()
+
+        _add_handlers(logger, log_file, log_format)
+        _current_config = (config, list(logger.handlers))
+
+    return logger
+
+def _add_handlers(logger, log_file, log_format):
+    """
+    Attach the console handler and optional file handler to the logger.
+
+    Args:
+        logger: Logger to attach the handlers to
+        log_file: Path to log file, or None to log to console only
+        log_format: Log format string for the console, or None for the message only
+    """
     # Create formatter
     if log_format is None:
         formatter = logging.Formatter(
@@ -52,5 +82,4 @@ def configure_logging(level=logging.WARNING, log_file=None, log_format=None):
         )
         file_handler.setFormatter(file_formatter)
         logger.addHandler(file_handler)
-    
-    return logger 
\ No newline at end of file
+ 
\ No newline at end of file
@@ -16,11 +16,14 @@ setup(
     install_requires=[
         'requests',
         'matplotlib',
-        'geopandas',
         'contextily',
         'shapely',
-        'pandas',
+        'pandas>=1.5',
+        'pyproj',
     ],
+    extras_require={
+        'fast': ['orjson'],
+    },
     entry_points={
         'console_scripts': [
             'pyfr24=pyfr24.cli:main',
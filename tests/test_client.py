@@ -4,10 +4,21 @@ Tests for the FR24API client.
 
 import os
 import json
+import asyncio
+import datetime
+import tempfile
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import requests
-from pyfr24 import FR24API, FR24Error, FR24AuthenticationError, FR24NotFoundError, FR24ConnectionError
+from pyfr24 import FR24API, FR24Error, FR24AuthenticationError, FR24NotFoundError, FR24ConnectionError, FR24RateLimitError
+
+def _make_response(payload=None, status_code=200, headers=None):
+    """Build a real requests.Response so the client's status, header and JSON handling runs."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = json.dumps(payload).encode() if payload is not None else b""
+    return response
 
 class TestFR24API(unittest.TestCase):
     """Test cases for the FR24API client."""
@@ -15,9 +26,34 @@ class TestFR24API(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.api = FR24API("test_token")
-        self.mock_response = MagicMock()
-        self.mock_response.json.return_value = {"data": "test_data"}
-        self.mock_response.status_code = 200  # Set default status code to 200 (success)
+        self.mock_response = _make_response({"data": "test_data"})
+    
+    def test_connection_pool_size(self):
+        """Test the session adapter uses the configured pool size."""
+        api = FR24API(token="test_token", pool_maxsize=32)
+        adapter = api.session.get_adapter("https://fr24api.flightradar24.com")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertFalse(adapter.max_retries.raise_on_status)
+    
+    def test_context_manager_closes_session(self):
+        """Test the client closes its own session but leaves shared sessions open."""
+        api = FR24API(token="test_token")
+        with patch.object(api.session, "close") as mock_close:
+            with api:
+                pass
+        mock_close.assert_called_once()
+        
+        shared = FR24API.from_shared(token="shared_token")
+        with patch.object(shared.session, "close") as mock_close:
+            shared.close()
+        mock_close.assert_not_called()
+    
+    def test_from_shared_reuses_session(self):
+        """Test clients created with from_shared share one session per token."""
+        first = FR24API.from_shared(token="shared_token")
+        second = FR24API.from_shared(token="shared_token")
+        self.assertIs(first.session, second.session)
+        self.assertIsNot(first.session, FR24API.from_shared(token="other_token").session)
     
     @patch('requests.Session.request')
     def test_get_flight_summary_light(self, mock_request):
@@ -97,12 +133,137 @@ class TestFR24API(unittest.TestCase):
         mock_request.assert_called_once()
         self.assertEqual(result, {"data": "test_data"})
     
+    @patch('requests.Session.request')
+    def test_get_flight_tracks_cached(self, mock_request):
+        """Test get_flight_tracks reuses cached responses until the cache is cleared."""
+        mock_request.return_value = self.mock_response
+        
+        first = self.api.get_flight_tracks("12345")
+        second = self.api.get_flight_tracks("12345")
+        
+        mock_request.assert_called_once()
+        self.assertEqual(first, second)
+        
+        self.api.clear_cache()
+        self.api.get_flight_tracks("12345")
+        self.assertEqual(mock_request.call_count, 2)
+    
+    @patch('pyfr24.client.time.monotonic')
+    @patch('requests.Session.request')
+    def test_get_flight_tracks_cache_expires(self, mock_request, mock_monotonic):
+        """Test tracks of a flight still in the air expire quickly and finished flights are kept for a day."""
+        recent = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        def tracks(request_method, url, params=None, **kwargs):
+            timestamp = recent if params["flight_id"] == "live" else "2025-01-01T12:00:00Z"
+            return _make_response([{"fr24_id": params["flight_id"], "tracks": [{"timestamp": timestamp}]}])
+        mock_request.side_effect = tracks
+        mock_monotonic.return_value = 1000.0
+        
+        self.api.get_flight_tracks("live")
+        self.api.get_flight_tracks("done")
+        mock_monotonic.return_value = 1000.0 + 61
+        self.api.get_flight_tracks("live")
+        self.api.get_flight_tracks("done")
+        self.assertEqual([c.kwargs["params"]["flight_id"] for c in mock_request.call_args_list], ["live", "done", "live"])
+        
+        mock_monotonic.return_value = 1000.0 + 86401
+        self.api.get_flight_tracks("done")
+        self.assertEqual(mock_request.call_count, 4)
+    
+    @patch('requests.Session.request')
+    def test_static_data_cached(self, mock_request):
+        """Test airline and airport lookups are fetched once per code."""
+        mock_request.return_value = self.mock_response
+        
+        self.api.get_airport_full("JFK")
+        self.api.get_airport_full("JFK")
+        self.api.get_airline_light("AAL")
+        self.api.get_airline_light("AAL")
+        
+        self.assertEqual(mock_request.call_count, 2)
+    
+    @patch('requests.Session.request')
+    def test_gather_flight_tracks(self, mock_request):
+        """Test gather_flight_tracks returns tracks keyed by flight ID."""
+        mock_request.return_value = self.mock_response
+        
+        result = self.api.gather_flight_tracks(["1", "2", "3"])
+        
+        self.assertEqual(list(result), ["1", "2", "3"])
+        self.assertEqual(result["2"], {"data": "test_data"})
+        self.assertEqual(mock_request.call_count, 3)
+    
+    @patch('requests.Session.request')
+    def test_gather_flight_tracks_failure(self, mock_request):
+        """Test one failing flight is recorded as None without losing the other flights."""
+        def tracks(request_method, url, params=None, **kwargs):
+            if params["flight_id"] == "bad":
+                return _make_response(status_code=404)
+            return self.mock_response
+        mock_request.side_effect = tracks
+        
+        result = self.api.gather_flight_tracks(["1", "bad", "3"])
+        async_result = asyncio.run(self.api.gather_flight_tracks_async(["1", "bad"]))
+        
+        self.assertEqual(result, {"1": {"data": "test_data"}, "bad": None, "3": {"data": "test_data"}})
+        self.assertEqual(async_result, {"1": {"data": "test_data"}, "bad": None})
+    
+    @patch('requests.Session.request')
+    def test_get_flight_ids_by_registration(self, mock_request):
+        """Test get_flight_ids_by_registration fetches every page and drops duplicates."""
+        def page(request_method, url, params=None, **kwargs):
+            ids = {0: ["a", "b"], 2: ["b", "c"], 4: ["d"]}.get(params["offset"], [])
+            return _make_response({"data": [{"fr24_id": i} for i in ids]})
+        mock_request.side_effect = page
+        
+        result = self.api.get_flight_ids_by_registration("N12345", "2025-01-01", "2025-01-31", limit=2, max_pages=4)
+        
+        self.assertEqual(result, ["a", "b", "c", "d"])
+        self.assertEqual(mock_request.call_count, 4)
+        
+        # Pages are cached, so repeating the lookup makes no new requests
+        self.api.get_flight_ids_by_registration("n12345", "2025-01-01", "2025-01-31", limit=2, max_pages=4)
+        self.assertEqual(mock_request.call_count, 4)
+    
+    @patch('requests.Session.request')
+    def test_iter_flight_ids_by_registration_stops_early(self, mock_request):
+        """Test iterating flight IDs only requests the pages that are consumed."""
+        mock_request.return_value = _make_response({"data": [{"fr24_id": "a"}, {"fr24_id": "b"}]})
+        
+        flight_ids = self.api.iter_flight_ids_by_registration("N12345", "2025-01-01", "2025-01-31", limit=2)
+        
+        self.assertEqual(next(flight_ids), "a")
+        self.assertEqual(mock_request.call_count, 1)
+    
+    @patch('pyfr24.client.FR24API.get_flight_ids_by_registration')
+    def test_get_flight_ids_by_registrations(self, mock_lookup):
+        """Test looking up several registrations records failures as None."""
+        def lookup(registration, date_from, date_to, **kwargs):
+            if registration == "BAD":
+                raise FR24NotFoundError("Resource not found")
+            return [f"{registration}-1"]
+        mock_lookup.side_effect = lookup
+        
+        result = self.api.get_flight_ids_by_registrations(["N1", "BAD"], "2025-01-01", "2025-01-31", registration_workers=2, max_workers=3)
+        
+        self.assertEqual(result, {"N1": ["N1-1"], "BAD": None})
+        # max_workers sets the page concurrency of each lookup
+        self.assertEqual(mock_lookup.call_args.kwargs, {"max_workers": 3})
+    
+    @patch('requests.Session.request')
+    def test_gather_flight_tracks_async(self, mock_request):
+        """Test the async tracks helper returns tracks keyed by flight ID."""
+        mock_request.return_value = self.mock_response
+        
+        result = asyncio.run(self.api.gather_flight_tracks_async(["1", "2"]))
+        
+        self.assertEqual(result, {"1": {"data": "test_data"}, "2": {"data": "test_data"}})
+        self.assertEqual(mock_request.call_count, 2)
+    
     @patch('requests.Session.request')
     def test_authentication_error(self, mock_request):
         """Test handling of authentication errors."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_request.return_value = mock_response
+        mock_request.return_value = _make_response(status_code=401)
         
         with self.assertRaises(FR24AuthenticationError):
             self.api.get_flight_summary_light(
@@ -114,9 +275,7 @@ class TestFR24API(unittest.TestCase):
     @patch('requests.Session.request')
     def test_not_found_error(self, mock_request):
         """Test handling of not found errors."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_request.return_value = mock_response
+        mock_request.return_value = _make_response(status_code=404)
         
         with self.assertRaises(FR24NotFoundError):
             self.api.get_flight_summary_light(
@@ -125,6 +284,43 @@ class TestFR24API(unittest.TestCase):
                 flight_datetime_to="2023-01-01T23:59:59Z"
             )
     
+    @patch('requests.Session.request')
+    def test_rate_limit_error_retry_after(self, mock_request):
+        """Test rate limit errors carry the server's Retry-After delay."""
+        mock_request.return_value = _make_response(status_code=429, headers={"Retry-After": "30"})
+        
+        with self.assertRaises(FR24RateLimitError) as context:
+            self.api.get_flight_tracks("12345")
+        
+        self.assertEqual(context.exception.retry_after, 30.0)
+    
+    @patch('pyfr24.client.time.sleep')
+    @patch('requests.Session.request')
+    def test_waits_when_rate_limit_exhausted(self, mock_request, mock_sleep):
+        """Test the client waits for the rate limit to reset before the next request."""
+        mock_request.return_value = _make_response({"data": "test_data"}, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "5"})
+        
+        self.api.get_flight_tracks("1")
+        mock_sleep.assert_not_called()
+        self.api.get_flight_tracks("2")
+        
+        mock_sleep.assert_called_once()
+        self.assertGreater(mock_sleep.call_args[0][0], 4)
+    
+    @patch('pyfr24.client.time.sleep')
+    @patch('requests.Session.request')
+    def test_rate_limit_wait_over_cap_raises(self, mock_request, mock_sleep):
+        """Test a rate limit resetting later than max_rate_limit_wait raises instead of sleeping."""
+        mock_request.return_value = _make_response({"data": "test_data"}, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "86400"})
+        
+        self.api.get_flight_tracks("1")
+        with self.assertRaises(FR24RateLimitError) as context:
+            self.api.get_flight_tracks("2")
+        
+        mock_sleep.assert_not_called()
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertGreater(context.exception.retry_after, 86000)
+    
     @patch('requests.Session.request')
     def test_connection_error(self, mock_request):
         """Test handling of connection errors."""
@@ -136,6 +332,148 @@ class TestFR24API(unittest.TestCase):
                 flight_datetime_from="2023-01-01T00:00:00Z",
                 flight_datetime_to="2023-01-01T23:59:59Z"
             )
+    
+    @patch('requests.Session.request')
+    def test_timeout_error(self, mock_request):
+        """Test timeouts are reported as connection errors."""
+        mock_request.side_effect = requests.exceptions.ReadTimeout("Read timed out")
+        
+        with self.assertRaises(FR24ConnectionError):
+            self.api.get_flight_tracks("12345")
+
+    @patch('requests.Session.request')
+    def test_default_timeout(self, mock_request):
+        """Test every request is sent with the client's timeout."""
+        mock_request.return_value = self.mock_response
+        api = FR24API("test_token", timeout=5)
+        
+        api.get_airline_light("AAL")
+        
+        self.assertEqual(mock_request.call_args.kwargs["timeout"], 5)
+
+    @patch('pyfr24.client.FR24API.export_flight_data')
+    def test_bulk_export(self, mock_export):
+        """Test bulk_export exports each flight and records failures."""
+        def export(flight_id, output_dir=None, **kwargs):
+            if flight_id == "bad":
+                raise FR24NotFoundError("Resource not found")
+            if flight_id == "full":
+                raise OSError("No space left on device")
+            return output_dir
+        mock_export.side_effect = export
+        
+        result = self.api.bulk_export(["abc", "bad", "full"], output_root="out", max_workers=2)
+        
+        self.assertEqual(result, {"abc": os.path.join("out", "abc"), "bad": None, "full": None})
+        self.assertEqual(mock_export.call_count, 3)
+
+    @patch('pyfr24.client._get_pyplot', side_effect=AssertionError("pyplot used off the main thread"))
+    def test_bulk_export_draws_without_pyplot(self, mock_pyplot):
+        """Test bulk_export worker threads save every plot without pyplot figures."""
+        tracks = [
+            {"timestamp": f"2025-04-22T14:{i:02d}:00Z", "lat": 40 + i * 0.01, "lon": -74 + i * 0.01, "alt": i * 100, "gspeed": i}
+            for i in range(10)
+        ]
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(FR24API, "get_flight_tracks", return_value=[{"fr24_id": "abc", "tracks": tracks}]):
+            result = self.api.bulk_export(["abc"], output_root=tmp, skip_basemap=True, dpi=20)
+            
+            for name in ("map.png", "speed.png", "altitude.png"):
+                self.assertTrue(os.path.exists(os.path.join(result["abc"], name)))
+        mock_pyplot.assert_not_called()
+
+    def test_export_flight_data_files(self):
+        """Test the exported CSV, GeoJSON and KML files read back with missing values handled."""
+        tracks = [
+            {"timestamp": f"2025-04-22T14:0{i}:00Z", "lat": 40 + i * 0.01, "lon": -74 + i * 0.01, "alt": i * 100, "gspeed": 300}
+            for i in range(5)
+        ]
+        tracks[2]["lon"] = None
+        tracks[3]["alt"] = None
+        valid = [track for track in tracks if track["lon"] is not None]
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(FR24API, "get_flight_tracks", return_value=[{"fr24_id": "a&b", "tracks": tracks}]):
+            self.api.export_flight_data("a&b", output_dir=tmp, simplify_tolerance_m=0, skip_basemap=True, dpi=20)
+            
+            with open(os.path.join(tmp, "data.csv"), newline="") as f:
+                rows = f.read().split("\r\n")
+            self.assertEqual(rows[0], "timestamp,lat,lon,alt,gspeed,vspeed,track,squawk,callsign,source")
+            self.assertEqual(rows[4], f"2025-04-22T14:03:00Z,{tracks[3]['lat']},{tracks[3]['lon']},,300,,,,,")
+            
+            with open(os.path.join(tmp, "points.geojson")) as f:
+                points = json.load(f)
+            self.assertEqual(len(points["features"]), len(tracks))
+            self.assertEqual(points["features"][2]["geometry"]["coordinates"], [None, tracks[2]["lat"]])
+            
+            with open(os.path.join(tmp, "line.geojson")) as f:
+                line = json.load(f)
+            self.assertEqual(line["features"][0]["geometry"]["coordinates"], [[t["lon"], t["lat"]] for t in valid])
+            
+            with open(os.path.join(tmp, "track.kml")) as f:
+                kml = f.read()
+            self.assertEqual(kml.count("<name>a&amp;b</name>"), 2)
+            coordinates = kml.split("<coordinates>\n")[1].split("\n        </coordinates>")[0].split("\n")
+            self.assertEqual(coordinates, [f"{t['lon']},{t['lat']},{t['alt'] or 0}" for t in valid])
+            
+            # The default tolerance drops the points in between on a straight path
+            self.api.export_flight_data("a&b", output_dir=tmp, skip_basemap=True, dpi=20)
+            with open(os.path.join(tmp, "line.geojson")) as f:
+                line = json.load(f)
+            self.assertEqual(line["features"][0]["geometry"]["coordinates"], [[-74.0, 40.0], [tracks[4]["lon"], tracks[4]["lat"]]])
+
+    @patch('pyfr24.client._get_web_mercator_transformer')
+    def test_enhanced_plot_flight_simplify(self, mock_transformer):
+        """Test enhanced_plot_flight simplifies the path before drawing it."""
+        transform = mock_transformer.return_value.transform
+        transform.side_effect = ValueError("stop before drawing")
+        tracks = [{"lon": -74 + i * 0.01, "lat": 40.0} for i in range(100)]
+        
+        self.api.enhanced_plot_flight(tracks, "abc", simplify_tolerance_m=50)
+        
+        lon, lat = transform.call_args[0]
+        self.assertEqual(list(lon), [-74.0, tracks[-1]["lon"]])
+
+    def test_enhanced_plot_flight_bare_filename(self):
+        """Test enhanced_plot_flight saves a file name without a directory."""
+        tracks = [{"lon": -74.0, "lat": 40.0}, {"lon": -73.0, "lat": 41.0}]
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                self.api.enhanced_plot_flight(tracks, "abc", fig_filename="map.png", skip_basemap=True, dpi=20)
+                self.assertTrue(os.path.exists("map.png"))
+            finally:
+                os.chdir(cwd)
+
+    def test_convert_timestamps(self):
+        """Test timestamps are converted in bulk, including mixed formats."""
+        from zoneinfo import ZoneInfo
+        from pyfr24.client import _convert_timestamps
+        tz = ZoneInfo("America/New_York")
+        
+        self.assertEqual(
+            _convert_timestamps(["2025-04-22T14:00:00Z", "2025-04-22T14:00:10"], tz),
+            ["2025-04-22T10:00:00-04:00", "2025-04-22T10:00:10-04:00"]
+        )
+        self.assertEqual(
+            _convert_timestamps(["2025-04-22T14:00:00+02:00", "2025-04-22T14:00:10.5Z"], tz),
+            ["2025-04-22T08:00:00-04:00", "2025-04-22T10:00:10.500000-04:00"]
+        )
+
+    def test_chart_series_mixed_timestamp_formats(self):
+        """Test chart points with and without fractional seconds are all kept."""
+        from pyfr24.client import _chart_series
+        tracks = [
+            {"timestamp": "2025-04-22T14:00:00Z", "alt": 1000},
+            {"timestamp": "2025-04-22T14:00:10.5Z", "alt": 2000},
+            {"timestamp": "2025-04-22T10:00:20.250000-04:00", "alt": 3000},
+            {"timestamp": "not a timestamp", "alt": 4000},
+        ]
+        
+        timestamps, altitudes = _chart_series(tracks, "alt", 50000)
+        
+        self.assertEqual(list(altitudes), [1000, 2000, 3000])
+        self.assertEqual(timestamps[2].isoformat(), "2025-04-22T14:00:20.250000+00:00")
 
 if __name__ == '__main__':
     unittest.main()
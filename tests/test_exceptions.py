@@ -29,6 +29,8 @@ class TestExceptions(unittest.TestCase):
         error = FR24RateLimitError("Rate limit exceeded")
         self.assertEqual(str(error), "Rate limit exceeded")
         self.assertIsInstance(error, FR24Error)
+        self.assertIsNone(error.retry_after)
+        self.assertEqual(FR24RateLimitError("Rate limit exceeded", retry_after=5).retry_after, 5)
     
     def test_fr24_not_found_error(self):
         """Test FR24NotFoundError."""
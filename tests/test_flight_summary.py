@@ -1,14 +1,13 @@
 import pytest
 from pyfr24 import FR24API
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Debug output is shown with pytest --log-level=DEBUG
 logger = logging.getLogger(__name__)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_token():
     """Fixture to get the API token from environment."""
     token = os.getenv('FLIGHTRADAR_API_KEY')
@@ -16,23 +15,24 @@ def api_token():
         pytest.skip("FLIGHTRADAR_API_KEY environment variable not set")
     return token
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(api_token):
     """Fixture to create and return an FR24API client."""
     return FR24API(token=api_token)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data():
     """Fixture containing test flight IDs and numbers."""
+    # Tuples, so tests sharing the fixture cannot change it
     return {
-        'flight_ids': ["39f4007e", "39f406c4"],    # Flight IDs
-        'flights': ["UA1930", "UA253"]  # Flight numbers
+        'flight_ids': ("39f4007e", "39f406c4"),    # Flight IDs
+        'flights': ("UA1930", "UA253")  # Flight numbers
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_dates():
     """Fixture to generate test date range."""
-    now = datetime.utcnow()  # Use UTC time
+    now = datetime.now(timezone.utc)
     today_start = now.replace(hour=0, minute=0, second=0).strftime("%Y-%m-%dT%H:%M:%SZ")
     today_end = now.replace(hour=23, minute=59, second=59).strftime("%Y-%m-%dT%H:%M:%SZ")
     return {
@@ -42,8 +42,8 @@ def test_dates():
 
 def test_single_flight_id(client, test_data, test_dates):
     """Test retrieving flight summary with a single flight ID."""
-    logger.debug(f"Making request with flight ID: {test_data['flight_ids'][0]}")
-    logger.debug(f"Date range: {test_dates['from']} to {test_dates['to']}")
+    logger.debug("Making request with flight ID: %s", test_data['flight_ids'][0])
+    logger.debug("Date range: %s to %s", test_dates['from'], test_dates['to'])
     
     result = client.get_flight_summary_light(
         flight_ids=test_data['flight_ids'][0],
@@ -58,8 +58,8 @@ def test_single_flight_id(client, test_data, test_dates):
 
 def test_single_flight_number(client, test_data, test_dates):
     """Test retrieving flight summary with a single flight number."""
-    logger.debug(f"Making request with flight number: {test_data['flights'][0]}")
-    logger.debug(f"Date range: {test_dates['from']} to {test_dates['to']}")
+    logger.debug("Making request with flight number: %s", test_data['flights'][0])
+    logger.debug("Date range: %s to %s", test_dates['from'], test_dates['to'])
     
     result = client.get_flight_summary_light(
         flights=test_data['flights'][0],
@@ -74,8 +74,8 @@ def test_single_flight_number(client, test_data, test_dates):
 
 def test_multiple_flight_ids(client, test_data, test_dates):
     """Test retrieving flight summary with multiple flight IDs."""
-    logger.debug(f"Making request with flight IDs: {test_data['flight_ids']}")
-    logger.debug(f"Date range: {test_dates['from']} to {test_dates['to']}")
+    logger.debug("Making request with flight IDs: %s", test_data['flight_ids'])
+    logger.debug("Date range: %s to %s", test_dates['from'], test_dates['to'])
     
     result = client.get_flight_summary_light(
         flight_ids=test_data['flight_ids'],
@@ -91,8 +91,8 @@ def test_multiple_flight_ids(client, test_data, test_dates):
 
 def test_multiple_flight_numbers(client, test_data, test_dates):
     """Test retrieving flight summary with multiple flight numbers."""
-    logger.debug(f"Making request with flight numbers: {test_data['flights']}")
-    logger.debug(f"Date range: {test_dates['from']} to {test_dates['to']}")
+    logger.debug("Making request with flight numbers: %s", test_data['flights'])
+    logger.debug("Date range: %s to %s", test_dates['from'], test_dates['to'])
     
     result = client.get_flight_summary_light(
         flights=test_data['flights'],
@@ -108,8 +108,8 @@ def test_multiple_flight_numbers(client, test_data, test_dates):
 
 def test_full_summary(client, test_data, test_dates):
     """Test retrieving full flight summary."""
-    logger.debug(f"Making full summary request with flight number: {test_data['flights'][0]}")
-    logger.debug(f"Date range: {test_dates['from']} to {test_dates['to']}")
+    logger.debug("Making full summary request with flight number: %s", test_data['flights'][0])
+    logger.debug("Date range: %s to %s", test_dates['from'], test_dates['to'])
     
     result = client.get_flight_summary_full(
         flights=test_data['flights'][0],
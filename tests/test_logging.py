@@ -5,12 +5,21 @@ Test logging configuration.
 import unittest
 import logging
 import tempfile
+import shutil
 import os
 from pyfr24 import configure_logging
 
 class TestLogging(unittest.TestCase):
     """Test logging configuration."""
     
+    def tearDown(self):
+        """Detach and close the handlers configured by the test."""
+        logger = logging.getLogger('pyfr24')
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+        logger.setLevel(logging.NOTSET)
+    
     def test_configure_logging_default(self):
         """Test configure_logging with default parameters."""
         logger = configure_logging()
@@ -22,21 +31,18 @@ class TestLogging(unittest.TestCase):
     
     def test_configure_logging_with_file(self):
         """Test configure_logging with a log file."""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            log_file = temp_file.name
+        temp_dir = tempfile.mkdtemp()
+        # Cleanups run after tearDown has closed the log file
+        self.addCleanup(shutil.rmtree, temp_dir)
+        log_file = os.path.join(temp_dir, "pyfr24.log")
         
-        try:
-            logger = configure_logging(log_file=log_file)
-            
-            self.assertEqual(logger.name, 'pyfr24')
-            self.assertEqual(logger.level, logging.WARNING)
-            self.assertTrue(len(logger.handlers) > 1)
-            self.assertIsInstance(logger.handlers[1], logging.handlers.RotatingFileHandler)
-            self.assertEqual(logger.handlers[1].baseFilename, log_file)
-        finally:
-            # Clean up the temporary file
-            if os.path.exists(log_file):
-                os.remove(log_file)
+        logger = configure_logging(log_file=log_file)
+        
+        self.assertEqual(logger.name, 'pyfr24')
+        self.assertEqual(logger.level, logging.WARNING)
+        self.assertTrue(len(logger.handlers) > 1)
+        self.assertIsInstance(logger.handlers[1], logging.handlers.RotatingFileHandler)
+        self.assertEqual(logger.handlers[1].baseFilename, log_file)
     
     def test_configure_logging_with_custom_level(self):
         """Test configure_logging with a custom level."""
@@ -55,5 +61,17 @@ class TestLogging(unittest.TestCase):
         self.assertTrue(len(logger.handlers) > 0)
         self.assertEqual(logger.handlers[0].formatter._fmt, custom_format)
 
+    def test_configure_logging_repeated(self):
+        """Test repeated identical calls keep the handlers and new settings replace them."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, "pyfr24.log")
+            handlers = list(configure_logging(log_file=log_file).handlers)
+            
+            self.assertEqual(configure_logging(log_file=log_file).handlers, handlers)
+            
+            logger = configure_logging()
+            self.assertEqual(len(logger.handlers), 1)
+            self.assertIsNone(handlers[1].stream)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -5,7 +5,7 @@ Usage: python update_version.py <new_version>
 Example: python update_version.py 0.1.1
 """
 
-import re
+import ast
 import sys
 
 def update_version(new_version):
@@ -13,12 +13,19 @@ def update_version(new_version):
     with open('setup.py', 'r') as f:
         content = f.read()
     
-    # Update version in setup.py
-    new_content = re.sub(
-        r"version=['\"][^'\"]*['\"]",
-        f"version='{new_version}'",
-        content
-    )
+    # Find the version argument of setup() so other strings are left alone
+    version = next((keyword.value for node in ast.walk(ast.parse(content))
+                    if isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'setup'
+                    for keyword in node.keywords if keyword.arg == 'version'), None)
+    if version is None or version.lineno != version.end_lineno:
+        sys.exit("No version found in setup.py")
+    
+    # Update version in setup.py (AST column offsets count UTF-8 bytes)
+    lines = content.splitlines(keepends=True)
+    line = lines[version.lineno - 1].encode()
+    line = line[:version.col_offset] + f"'{new_version}'".encode() + line[version.end_col_offset:]
+    lines[version.lineno - 1] = line.decode()
+    new_content = "".join(lines)
     
     with open('setup.py', 'w') as f:
         f.write(new_content)